@@ -17,13 +17,25 @@ executado diretamente.
 from __future__ import annotations
 
 import json
-from dataclasses import dataclass
-from datetime import date, datetime, time, timedelta
+import os
+import sys
+import tempfile
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from datetime import date, datetime, timedelta
+from functools import lru_cache
 from time import perf_counter
-from typing import Dict, Iterable, List, Optional, Sequence
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Set, Tuple
 
 import holidays
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:  # ``orjson`` é opcional; sem ele o decodificador padrão é utilizado.
+    import orjson
+except ImportError:  # pragma: no cover - depende do ambiente
+    orjson = None
 
 
 SCHEDULE_URL = "https://studiovelocity.com.br/api/v1/events/schedule/"
@@ -38,6 +50,28 @@ DEFAULT_SCHEDULE_PARAMS = {
     "timezone_from_unit": "35",
 }
 
+# Instrutor cujas aulas são monitoradas pela automação.
+DEFAULT_INSTRUCTOR_ID = 525
+
+# Em dias úteis apenas aulas estritamente após este horário ``(hora, minuto)``
+# são consideradas.
+EVENING_CUTOFF: Tuple[int, int] = (19, 0)
+
+# Páginas da agenda baixadas por padrão. A primeira é consultada sozinha e as
+# demais só são requisitadas quando a API informa uma próxima página.
+DEFAULT_SCHEDULE_PAGES: Tuple[int, ...] = (1, 2)
+
+# Quantidade máxima de detalhes de eventos buscados simultaneamente.
+EVENT_DETAILS_MAX_WORKERS = 8
+
+# Cabeçalhos enviados em todas as requisições da sessão compartilhada.
+DEFAULT_HEADERS = {
+    "User-Agent": "studiovelocity-bot/1.0",
+}
+
+# Tamanho do pool de conexões HTTP compartilhado por todas as threads.
+HTTP_POOL_SIZE = 16
+
 
 @dataclass
 class ScheduleEvent:
@@ -67,12 +101,16 @@ class AutomationResult:
         }
 
 
+@lru_cache(maxsize=4096)
 def _parse_start_time(raw_start: str) -> datetime:
     """Converte o valor ``start_time`` retornado pela API para ``datetime``.
 
     A API retorna strings no formato ISO 8601 com fuso horário (por exemplo,
     ``"2025-11-14T19:30:00-03:00"``). ``datetime.fromisoformat`` entende esse
     formato, portanto podemos fazer o parse diretamente.
+
+    Como ``datetime`` é imutável, o resultado é memoizado por string: eventos
+    repetidos entre páginas ou execuções no mesmo processo reaproveitam o parse.
     """
 
     try:
@@ -81,20 +119,179 @@ def _parse_start_time(raw_start: str) -> datetime:
         raise ValueError(f"Valor de start_time inválido: {raw_start}") from exc
 
 
+@dataclass
+class EventDetailsCache:
+    """Cache dos detalhes de eventos validado pelo ``ETag`` da API.
+
+    Cada entrada guarda ``(etag, payload)`` por token. Em execuções seguintes
+    o ``ETag`` é enviado em ``If-None-Match`` e, quando a API responde ``304``,
+    o payload armazenado é reutilizado sem baixar o corpo novamente.
+
+    ``touched`` registra os tokens buscados ou revalidados na execução atual;
+    apenas eles são persistidos por ``save``, descartando aulas que já saíram
+    da agenda.
+    """
+
+    entries: Dict[str, Tuple[str, Dict]] = field(default_factory=dict)
+    touched: Set[str] = field(default_factory=set)
+
+    @classmethod
+    def load(cls, path: str) -> "EventDetailsCache":
+        """Carrega o cache de um arquivo JSON, ignorando arquivos ausentes ou inválidos."""
+
+        try:
+            with open(path, encoding="utf-8") as cache_file:
+                raw_entries = json.load(cache_file)
+        except (OSError, ValueError):
+            return cls()
+
+        if not isinstance(raw_entries, dict):
+            return cls()
+
+        entries = {
+            token: (entry["etag"], entry["payload"])
+            for token, entry in raw_entries.items()
+            if isinstance(entry, dict) and entry.get("etag") and "payload" in entry
+        }
+        return cls(entries=entries)
+
+    def save(self, path: str) -> None:
+        """Persiste em um arquivo JSON as entradas usadas na execução atual.
+
+        O conteúdo é gravado em um arquivo temporário no mesmo diretório e
+        movido com ``os.replace``, para que uma execução interrompida não
+        deixe o cache truncado. Falhas de escrita propagam ``OSError``; se o
+        próprio arquivo temporário não puder ser criado, nada precisa ser
+        removido.
+        """
+
+        raw_entries = {
+            token: {"etag": etag, "payload": payload}
+            for token, (etag, payload) in self.entries.items()
+            if token in self.touched
+        }
+
+        directory = os.path.dirname(os.path.abspath(path))
+        fd, temp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as cache_file:
+                json.dump(raw_entries, cache_file, ensure_ascii=False)
+            os.replace(temp_path, path)
+        except BaseException:
+            try:
+                os.unlink(temp_path)
+            except OSError:  # pragma: no cover - limpeza de melhor esforço
+                pass
+            raise
+
+
+def create_session() -> requests.Session:
+    """Cria uma ``requests.Session`` com pool de conexões e retentativas.
+
+    O pool comporta todas as requisições simultâneas da automação para que as
+    conexões TLS com o host da API sejam reaproveitadas entre as threads.
+    Falhas transitórias do servidor (502, 503 e 504) em requisições ``GET``
+    são repetidas com backoff exponencial.
+    """
+
+    retry = Retry(
+        total=3,
+        backoff_factor=0.3,
+        status_forcelist=(502, 503, 504),
+        allowed_methods=("GET",),
+        raise_on_status=False,
+    )
+    pool_size = max(HTTP_POOL_SIZE, len(DEFAULT_SCHEDULE_PAGES), EVENT_DETAILS_MAX_WORKERS)
+
+    session = requests.Session()
+    session.headers.update(DEFAULT_HEADERS)
+    adapter = HTTPAdapter(
+        pool_connections=pool_size,
+        pool_maxsize=pool_size,
+        max_retries=retry,
+    )
+    session.mount("https://", adapter)
+    return session
+
+
+def _decode_json(response: requests.Response) -> Dict:
+    """Decodifica o corpo JSON da resposta, preferindo ``orjson`` quando instalado."""
+
+    if orjson is None:
+        return response.json()
+
+    return orjson.loads(response.content)
+
+
+def _fetch_page(
+    session: requests.Session,
+    page: int,
+    base_params: Dict[str, str],
+) -> Tuple[List[Dict], bool]:
+    """Baixa uma única página da agenda e retorna ``(results, has_next)``.
+
+    ``has_next`` indica se a API informou uma próxima página (campo ``next``).
+    """
+
+    params = {**base_params, "page": str(page)}
+
+    response = session.get(SCHEDULE_URL, params=params, timeout=30)
+
+    # Em determinados períodos a API pode retornar 404 para páginas fora do
+    # intervalo disponível. Isso não deve derrubar toda a automação: a página
+    # é tratada como vazia e encerra a paginação, já que não existem mais
+    # resultados naquele range.
+    if response.status_code == 404:
+        return [], False
+
+    response.raise_for_status()
+    payload = _decode_json(response)
+
+    results = payload.get("results", [])
+    if not isinstance(results, list):  # pragma: no cover - programação defensiva
+        raise TypeError("Payload de agenda inesperado: 'results' não é uma lista")
+
+    return results, payload.get("next") is not None
+
+
+def _parse_start_prefix(raw_start: str) -> Tuple[date, int, int]:
+    """Extrai data, hora e minuto do prefixo ``YYYY-MM-DDTHH:MM`` de ``start_time``.
+
+    É suficiente para aplicar as regras de filtragem sem construir o
+    ``datetime`` completo (com fuso horário) de eventos que serão descartados.
+    """
+
+    try:
+        event_date = date(int(raw_start[0:4]), int(raw_start[5:7]), int(raw_start[8:10]))
+        return event_date, int(raw_start[11:13]), int(raw_start[14:16])
+    except ValueError as exc:  # pragma: no cover - programação defensiva
+        raise ValueError(f"Valor de start_time inválido: {raw_start}") from exc
+
+
 def fetch_schedule(
     session: requests.Session,
     *,
-    pages: Sequence[int] = (1, 2),
+    pages: Sequence[int] = DEFAULT_SCHEDULE_PAGES,
     start: Optional[date] = None,
     end: Optional[date] = None,
+    instructor_id: Optional[int] = None,
 ) -> List[Dict]:
     """Busca eventos da agenda para a janela de datas selecionada.
 
+    A primeira página é baixada sozinha: quando a API indica que não há
+    próxima página (``next`` nulo), as demais não são requisitadas. Caso
+    contrário, as páginas restantes são baixadas (em paralelo quando há mais
+    de uma) e os resultados são combinados respeitando a ordem das páginas.
+
     Args:
         session: instância de ``requests.Session`` utilizada para chamadas HTTP.
         pages: páginas que serão baixadas do endpoint de agenda.
         start: data inicial da janela (inclusiva). Padrão: hoje.
         end: data final da janela (inclusiva). Padrão: ``start`` + 14 dias.
+        instructor_id: quando informado, é enviado no parâmetro ``instructor``
+            (o nome ecoado pela API no link ``next`` de ``reservar_bike.txt``).
+            Não há garantia de que o servidor aplique o filtro, então quem
+            chama deve manter a checagem local do instrutor.
 
     Returns:
         Lista com os ``results`` combinados de todas as páginas baixadas.
@@ -105,68 +302,73 @@ def fetch_schedule(
     if end is None:
         end = start + timedelta(days=14)
 
-    aggregated_results: List[Dict] = []
-    for page in pages:
-        params = {
-            **DEFAULT_SCHEDULE_PARAMS,
-            "page": str(page),
-            "date_from": start.strftime("%Y-%m-%d"),
-            "date_to": end.strftime("%Y-%m-%d"),
-        }
-
-        response = session.get(SCHEDULE_URL, params=params, timeout=30)
+    if not pages:
+        return []
 
-        # Em determinados períodos a API pode retornar 404 para páginas fora do
-        # intervalo disponível. Isso não deve derrubar toda a automação, pois
-        # significa apenas que não existem mais resultados naquele range.
-        if response.status_code == 404:
-            continue
+    base_params = {
+        **DEFAULT_SCHEDULE_PARAMS,
+        "date_from": start.strftime("%Y-%m-%d"),
+        "date_to": end.strftime("%Y-%m-%d"),
+    }
+    if instructor_id is not None:
+        base_params["instructor"] = str(instructor_id)
 
-        response.raise_for_status()
-        payload = response.json()
+    first_page, *remaining_pages = pages
+    aggregated_results, has_next = _fetch_page(session, first_page, base_params)
 
-        results = payload.get("results", [])
-        if not isinstance(results, list):  # pragma: no cover - programação defensiva
-            raise TypeError("Payload de agenda inesperado: 'results' não é uma lista")
+    if not has_next or not remaining_pages:
+        return aggregated_results
 
+    if len(remaining_pages) == 1:
+        page_results = [_fetch_page(session, remaining_pages[0], base_params)]
+    else:
+        with ThreadPoolExecutor(max_workers=len(remaining_pages)) as executor:
+            page_results = list(
+                executor.map(
+                    lambda page: _fetch_page(session, page, base_params),
+                    remaining_pages,
+                )
+            )
+
+    for results, _ in page_results:
         aggregated_results.extend(results)
 
     return aggregated_results
 
 
-def classify_event_day(start_dt: datetime, *, estado: str = "SP") -> str:
-    """Classifica o dia do evento como ``dia_de_semana``, ``final_de_semana`` ou ``feriado``.
+def build_holiday_calendar(
+    years: Iterable[int], *, estado: str = "SP"
+) -> holidays.HolidayBase:
+    """Monta o calendário de feriados brasileiros para os anos informados.
 
     Args:
-        start_dt: ``datetime`` do início da aula.
+        years: anos que devem estar presentes no calendário.
         estado: sigla do estado brasileiro utilizado para o calendário de feriados.
-
-    Returns:
-        Uma das strings ``"feriado"``, ``"final_de_semana"`` ou ``"dia_de_semana"``.
     """
 
-    br_holidays = holidays.country_holidays(
-        "BR", subdiv=estado, years={start_dt.year}
-    )
+    return holidays.country_holidays("BR", subdiv=estado, years=set(years))
 
-    if start_dt.date() in br_holidays:
-        return "feriado"
 
-    if start_dt.weekday() >= 5:
-        return "final_de_semana"
-
-    return "dia_de_semana"
-
-
-def filter_events(
+def iter_filtered_events(
     raw_events: Iterable[Dict],
     *,
-    instructor_id: int = 525,
-) -> List[ScheduleEvent]:
-    """Filtra os eventos da agenda conforme as regras de negócio."""
+    instructor_id: int = DEFAULT_INSTRUCTOR_ID,
+    estado: str = "SP",
+    br_holidays: Optional[holidays.HolidayBase] = None,
+) -> Iterator[ScheduleEvent]:
+    """Produz os eventos da agenda que atendem às regras de negócio.
+
+    Cada evento é entregue assim que é aprovado, permitindo que a busca dos
+    detalhes comece enquanto o restante da agenda ainda está sendo filtrado.
+
+    Quando ``br_holidays`` não é informado, um único calendário é montado para
+    todo o lote. Ele é criado sem anos fixos e, como a biblioteca ``holidays``
+    expande o calendário sob demanda, cada ano consultado é populado apenas
+    uma vez.
+    """
 
-    filtered: List[ScheduleEvent] = []
-    evening_cutoff = time(hour=19)
+    if br_holidays is None:
+        br_holidays = build_holiday_calendar((), estado=estado)
 
     for event in raw_events:
         if event.get("instructor") != instructor_id:
@@ -179,26 +381,72 @@ def filter_events(
         if not start_raw:
             continue  # Ignora entradas malformadas de forma silenciosa.
 
+        event_date, hour, minute = _parse_start_prefix(start_raw)
+
+        # Feriados e finais de semana são sempre aceitos; em dias úteis apenas
+        # aulas estritamente após ``EVENING_CUTOFF`` são válidas.
+        if (
+            event_date.weekday() < 5
+            and (hour, minute) <= EVENING_CUTOFF
+            and event_date not in br_holidays
+        ):
+            continue
+
+        # O ``datetime`` completo só é construído para os eventos aceitos.
         start_dt = _parse_start_time(start_raw)
+        yield ScheduleEvent(token=event["token"], start_time=start_dt)
 
-        day_classification = classify_event_day(start_dt)
 
-        if day_classification == "dia_de_semana" and start_dt.timetz().replace(tzinfo=None) <= evening_cutoff:
-            # Apenas aulas estritamente após 19h em dias de semana são válidas.
-            continue
+def filter_events(
+    raw_events: Iterable[Dict],
+    *,
+    instructor_id: int = DEFAULT_INSTRUCTOR_ID,
+    estado: str = "SP",
+    br_holidays: Optional[holidays.HolidayBase] = None,
+) -> List[ScheduleEvent]:
+    """Filtra os eventos da agenda conforme as regras de negócio."""
 
-        filtered.append(ScheduleEvent(token=event["token"], start_time=start_dt))
+    return list(
+        iter_filtered_events(
+            raw_events,
+            instructor_id=instructor_id,
+            estado=estado,
+            br_holidays=br_holidays,
+        )
+    )
 
-    return filtered
 
+def fetch_event_details(
+    session: requests.Session,
+    token: str,
+    *,
+    cache: Optional[EventDetailsCache] = None,
+) -> Dict:
+    """Busca os detalhes para um token de evento específico.
 
-def fetch_event_details(session: requests.Session, token: str) -> Dict:
-    """Busca os detalhes para um token de evento específico."""
+    Quando ``cache`` é informado, a requisição é condicional: um ``304`` da API
+    reaproveita o payload armazenado e respostas com ``ETag`` atualizam o cache.
+    """
 
     url = f"{EVENT_URL}{token}/"
-    response = session.get(url, timeout=30)
+    cached = cache.entries.get(token) if cache is not None else None
+
+    headers = {"If-None-Match": cached[0]} if cached is not None else None
+    response = session.get(url, headers=headers, timeout=30)
+
+    if cached is not None and response.status_code == 304:
+        cache.touched.add(token)
+        return cached[1]
+
     response.raise_for_status()
-    return response.json()
+    payload = _decode_json(response)
+
+    etag = response.headers.get("ETag")
+    if cache is not None and etag:
+        cache.entries[token] = (etag, payload)
+        cache.touched.add(token)
+
+    return payload
 
 
 def extract_available_spots(event_payload: Dict, start_time: datetime) -> List[Dict]:
@@ -211,59 +459,93 @@ def extract_available_spots(event_payload: Dict, start_time: datetime) -> List[D
     instructor_name = " ".join(part for part in (first_name, last_name) if part).strip()
     tagline = event_payload.get("tagline", "🚲")
 
-    duration_time = event_payload.get("duration_time")
-    event_hour = event_payload.get("event_hour")
-    event_name = event_payload.get("name")
-    token = event_payload.get("token")
+    # Campos comuns a todas as vagas do evento, montados uma única vez. A chave
+    # ``spot_code`` fica reservada aqui para preservar a ordem do JSON final.
+    base_spot = {
+        "token": event_payload.get("token"),
+        "spot_code": None,
+        "event_name": event_payload.get("name"),
+        "event_hour": event_payload.get("event_hour"),
+        "duration_time": event_payload.get("duration_time"),
+        "instructor_nickname": nickname,
+        "instructor_name": instructor_name,
+        "instructor_tagline": tagline,
+        "start_time": start_time.isoformat(),
+    }
 
     available_spots: List[Dict] = []
 
     for spot in event_payload.get("map_spots", []):
-        bookings = spot.get("bookings", [])
-        maintenance = spot.get("maintenance", False)
-
-        if bookings or maintenance:
+        if spot.get("bookings") or spot.get("maintenance"):
             continue
 
-        available_spots.append(
-            {
-                "token": token,
-                "spot_code": spot.get("code"),
-                "event_name": event_name,
-                "event_hour": event_hour,
-                "duration_time": duration_time,
-                "instructor_nickname": nickname,
-                "instructor_name": instructor_name,
-                "instructor_tagline": tagline,
-                "start_time": start_time.isoformat(),
-            }
-        )
+        available_spot = base_spot.copy()
+        available_spot["spot_code"] = spot.get("code")
+        available_spots.append(available_spot)
 
     return available_spots
 
 
 def collect_available_spots(
     session: requests.Session,
-    schedule_events: Sequence[ScheduleEvent],
+    schedule_events: Iterable[ScheduleEvent],
+    *,
+    cache: Optional[EventDetailsCache] = None,
 ) -> List[Dict]:
-    """Busca detalhes de cada evento e consolida os lugares disponíveis."""
+    """Busca detalhes de cada evento e consolida os lugares disponíveis.
+
+    As requisições de detalhes são disparadas em paralelo à medida que os
+    eventos são consumidos de ``schedule_events`` (que pode ser um gerador,
+    como ``iter_filtered_events``) e cada payload é processado assim que sua
+    resposta chega. As vagas são devolvidas na ordem da agenda, independente
+    da ordem em que as respostas chegam.
+    """
+
+    spots_by_index: Dict[int, List[Dict]] = {}
+    with ThreadPoolExecutor(max_workers=EVENT_DETAILS_MAX_WORKERS) as executor:
+        futures = {
+            executor.submit(
+                fetch_event_details, session, schedule_event.token, cache=cache
+            ): (index, schedule_event)
+            for index, schedule_event in enumerate(schedule_events)
+        }
+
+        try:
+            for future in as_completed(futures):
+                index, schedule_event = futures[future]
+                spots_by_index[index] = extract_available_spots(
+                    future.result(), schedule_event.start_time
+                )
+        except BaseException:
+            # Uma falha já invalida o resultado; descarta as requisições que
+            # ainda estão na fila em vez de esperar por todas elas.
+            executor.shutdown(wait=False, cancel_futures=True)
+            raise
 
     all_spots: List[Dict] = []
-    for schedule_event in schedule_events:
-        payload = fetch_event_details(session, schedule_event.token)
-        all_spots.extend(
-            extract_available_spots(payload, schedule_event.start_time)
-        )
+    for index in range(len(futures)):
+        all_spots.extend(spots_by_index[index])
 
     return all_spots
 
 
-def run_automation(session: Optional[requests.Session] = None) -> AutomationResult:
-    """Executa o fluxo completo e retorna as vagas disponíveis com métricas."""
+def run_automation(
+    session: Optional[requests.Session] = None,
+    *,
+    cache_path: Optional[str] = None,
+) -> AutomationResult:
+    """Executa o fluxo completo e retorna as vagas disponíveis com métricas.
+
+    Args:
+        session: sessão HTTP reutilizada nas chamadas. Quando omitida, uma nova
+            sessão é criada e fechada ao final.
+        cache_path: arquivo JSON usado para persistir o ``EventDetailsCache``
+            entre execuções. Sem ele, os detalhes são sempre baixados por completo.
+    """
 
     should_close_session = False
     if session is None:
-        internal_session = requests.Session()
+        internal_session = create_session()
         should_close_session = True
     else:
         internal_session = session
@@ -271,9 +553,34 @@ def run_automation(session: Optional[requests.Session] = None) -> AutomationResu
     started_at = datetime.now().astimezone()
     timer_start = perf_counter()
 
-    schedule = fetch_schedule(internal_session)
-    filtered_events = filter_events(schedule)
-    available_spots = collect_available_spots(internal_session, filtered_events)
+    # O calendário de feriados não depende da agenda, então é montado em
+    # paralelo enquanto a requisição HTTP está em andamento.
+    today = date.today()
+    holiday_years = {today.year, (today + timedelta(days=14)).year}
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        holiday_future = executor.submit(build_holiday_calendar, holiday_years)
+        schedule = fetch_schedule(
+            internal_session, start=today, instructor_id=DEFAULT_INSTRUCTOR_ID
+        )
+        br_holidays = holiday_future.result()
+
+    cache = EventDetailsCache.load(cache_path) if cache_path else None
+
+    filtered_events = iter_filtered_events(schedule, br_holidays=br_holidays)
+    available_spots = collect_available_spots(
+        internal_session, filtered_events, cache=cache
+    )
+
+    if cache is not None and cache_path:
+        # O cache é apenas uma otimização: uma falha ao gravá-lo não deve
+        # impedir que as vagas encontradas sejam devolvidas.
+        try:
+            cache.save(cache_path)
+        except OSError as exc:
+            print(
+                f"Não foi possível salvar o cache em {cache_path}: {exc}",
+                file=sys.stderr,
+            )
 
     finished_at = datetime.now().astimezone()
     elapsed_seconds = perf_counter() - timer_start
@@ -294,7 +601,14 @@ def main() -> None:
 
     result = run_automation()
 
-    print(json.dumps(result.to_dict(), ensure_ascii=False, indent=2))
+    if orjson is None:
+        print(json.dumps(result.to_dict(), ensure_ascii=False, indent=2))
+        return
+
+    # ``orjson`` já produz UTF-8, então os bytes vão direto para o stdout.
+    sys.stdout.buffer.write(orjson.dumps(result.to_dict(), option=orjson.OPT_INDENT_2))
+    sys.stdout.buffer.write(b"\n")
+    sys.stdout.flush()
 
 
 if __name__ == "__main__":
@@ -129,7 +129,7 @@ def format_spot_summary(spots: Iterable[Dict[str, Any]]) -> FormattedSummary:
     """Gera mensagens amigáveis (HTML e texto plano) para envio e logs."""
 
     spots_list = sorted(
-        list(spots),
+        spots,
         key=lambda item: item.get("start_time") or item.get("event_hour") or "",
     )
 
@@ -140,7 +140,7 @@ def format_spot_summary(spots: Iterable[Dict[str, Any]]) -> FormattedSummary:
             plain_text=message,
         )
 
-    grouped_by_day: Dict[str, OrderedDict[str, Dict[str, Any]]] = {}
+    grouped_by_day: Dict[str, OrderedDict[Tuple[str, str, str, str], Dict[str, Any]]] = {}
     day_order: List[str] = []
 
     for spot in spots_list:
@@ -151,13 +151,11 @@ def format_spot_summary(spots: Iterable[Dict[str, Any]]) -> FormattedSummary:
             grouped_by_day[day_key] = OrderedDict()
             day_order.append(day_key)
 
-        event_key = "|".join(
-            [
-                spot.get("token") or "sem-token",
-                spot.get("start_time") or "sem-inicio",
-                spot.get("event_hour") or "sem-horario",
-                spot.get("event_name") or "sem-nome",
-            ]
+        event_key = (
+            spot.get("token") or "sem-token",
+            spot.get("start_time") or "sem-inicio",
+            spot.get("event_hour") or "sem-horario",
+            spot.get("event_name") or "sem-nome",
         )
 
         event_group = grouped_by_day[day_key].setdefault(
@@ -232,12 +230,9 @@ def format_spot_summary(spots: Iterable[Dict[str, Any]]) -> FormattedSummary:
             tagline = representative_spot.get("instructor_tagline")
 
             bike_codes = [
-                code
-                for code in (
-                    spot_item.get("spot_code")
-                    for spot_item in spots_for_event
-                )
-                if code
+                spot_item["spot_code"]
+                for spot_item in spots_for_event
+                if spot_item.get("spot_code")
             ]
             bikes_html, bikes_text = _format_bike_codes(bike_codes)
 
@@ -394,35 +389,41 @@ def main() -> None:
         else:
             chat_id = personal_chat or group_chat
 
-    result = automation.run_automation()
-    available_spots = result.spots
-    summary = format_spot_summary(available_spots)
+    # Uma única sessão atende a automação e o envio ao Telegram, compartilhando
+    # o pool de conexões configurado em ``automation.create_session``.
+    with automation.create_session() as session:
+        result = automation.run_automation(
+            session,
+            cache_path=os.environ.get("EVENT_CACHE_PATH") or None,
+        )
+        available_spots = result.spots
+        summary = format_spot_summary(available_spots)
 
-    execution_report = (
-        "Tempo total da automação: "
-        f"{result.elapsed_seconds:.2f} segundos (início: {result.started_at.isoformat()} | "
-        f"fim: {result.finished_at.isoformat()})."
-    )
+        execution_report = (
+            "Tempo total da automação: "
+            f"{result.elapsed_seconds:.2f} segundos (início: {result.started_at.isoformat()} | "
+            f"fim: {result.finished_at.isoformat()})."
+        )
 
-    summary_path = os.environ.get("GITHUB_STEP_SUMMARY")
-    if summary_path:
-        with open(summary_path, "a", encoding="utf-8") as summary_file:
-            summary_file.write(f"{execution_report}\n\n{summary.plain_text}\n")
+        summary_path = os.environ.get("GITHUB_STEP_SUMMARY")
+        if summary_path:
+            with open(summary_path, "a", encoding="utf-8") as summary_file:
+                summary_file.write(f"{execution_report}\n\n{summary.plain_text}\n")
 
-    if args.dry_run:
-        print(summary.plain_text)
-        print()
-        print(execution_report)
-        return
+        if args.dry_run:
+            print(summary.plain_text)
+            print()
+            print(execution_report)
+            return
 
-    if not available_spots:
-        print(summary.plain_text)
-        print()
-        print(execution_report)
-        return
+        if not available_spots:
+            print(summary.plain_text)
+            print()
+            print(execution_report)
+            return
 
-    send_telegram_message(token or "", chat_id or "", summary.html)
-    print(execution_report)
+        send_telegram_message(token or "", chat_id or "", summary.html, session=session)
+        print(execution_report)
 
 
 if __name__ == "__main__":